@@ -13,70 +13,21 @@ Usage examples:
     ./run-deploy.py --config=config.ini
 """
 
-import argparse
 import os
-import subprocess
-import configparser
 import sys
 import shutil
-import json
+import re
+import functools
+from types import MappingProxyType, SimpleNamespace
 
-def load_config(path):
-    """Load configuration values from a config file if provided"""
-    config = configparser.ConfigParser()
-    config.read(path)
-    result = {}
-    if 'DEFAULT' in config:
-        default = config['DEFAULT']
-        for key in default:
-            result[key] = default[key]
-    return result
-
-def get_user_action_choice():
-    """Prompt user to select an action"""
-    actions = [
-        "add-config-gh-pages", 
-        "add-config-bundle", 
-        "build-gh-pages", 
-        "deploy-gh-pages", 
-        "generate-bundle",
-        "update-index-tsx",
-        "generate-config",
-        "deploy-next-gh-pages"
-    ]
-
-    print("Please select an action:")
-    for i, action in enumerate(actions, 1):
-        print(f"{i}. {action}")
-
-    while True:
-        try:
-            choice = input("Enter the number of your choice: ").strip()
-            choice_idx = int(choice) - 1
-            if 0 <= choice_idx < len(actions):
-                return actions[choice_idx]
-            else:
-                print(f"Please enter a number between 1 and {len(actions)}")
-        except ValueError:
-            print("Please enter a valid number")
-        except KeyboardInterrupt:
-            print()
-            sys.exit(1)
-
-def create_gh_pages_config(app_base_path, verbose=False, dry_run=False):
-    """Create vite.gh-pages.config.ts file"""
-    config_file = "vite.gh-pages.config.ts"
+# configparser, subprocess, json and concurrent.futures are imported
+# inside the functions that need them to keep startup fast for simple actions
 
-    # Check if file already exists
-    if os.path.exists(config_file):
-        print(f"Error: {config_file} already exists. Aborting.")
-        sys.exit(1)
-
-    if verbose:
-        print(f"Preparing to create {config_file} with app base path: {app_base_path}")
+# Directory holding this script and its templates, resolved once at import
+_SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 
-    # Create the file with the specified content
-    content = f"""import path from 'path';
+# Vite config templates, rendered with str.format_map (literal braces are doubled)
+_GH_PAGES_TEMPLATE = """import path from 'path';
 import {{ defineConfig, loadEnv }} from 'vite';
 import react from '@vitejs/plugin-react';
 
@@ -96,35 +47,7 @@ export default defineConfig(({{ mode }}) => {{
 }});
 """
 
-    if dry_run:
-        print(f"[DRY RUN] Would create {config_file} with app base path: {app_base_path}")
-    else:
-        with open(config_file, 'w') as f:
-            f.write(content)
-        print(f"Created {config_file} with app base path: {app_base_path}")
-
-    return True
-
-def create_bundle_config(app_name, verbose=False, dry_run=False):
-    """Create vite.react-angular.config.ts file"""
-    config_file = "vite.react-angular.config.ts"
-
-    # Check if file already exists
-    if os.path.exists(config_file):
-        print(f"Error: {config_file} already exists. Aborting.")
-        sys.exit(1)
-
-    # Create dashed version and capitalized version of app name
-    app_name_dashed = app_name.replace(' ', '-').lower()
-    app_name_caps = ''.join(word.capitalize() for word in app_name.split('-'))
-
-    if verbose:
-        print(f"Preparing to create {config_file} with app name: {app_name}")
-        print(f"App name dashed: {app_name_dashed}")
-        print(f"App name capitalized: {app_name_caps}")
-
-    # Create the file with the specified content
-    content = f"""import path from 'path';
+_BUNDLE_TEMPLATE = """import path from 'path';
 import {{ defineConfig, loadEnv }} from 'vite';
 import react from '@vitejs/plugin-react';
 
@@ -169,109 +92,353 @@ export default defineConfig(({{ mode }}) => {{
 }});
 """
 
+def get_cache_dir():
+    """Return the per-user cache directory for this script"""
+    if os.name == 'nt':
+        base = os.environ.get('LOCALAPPDATA') or os.path.expanduser('~')
+    else:
+        base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'run-deploy')
+
+def cached_config(func):
+    """Cache config parsing results, invalidated when the file's mtime or size changes"""
+    @functools.lru_cache(maxsize=None)
+    def load_cached(path, mtime_ns, size):
+        import json
+
+        # Stored as JSON, never pickle: the cache dir may be shared or writable by others
+        cache_file = os.path.join(get_cache_dir(), 'config.json')
+        try:
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                disk_cache = json.load(f)
+            if not isinstance(disk_cache, dict):
+                disk_cache = {}
+        except (OSError, ValueError):
+            disk_cache = {}
+
+        entry = disk_cache.get(path)
+        if (isinstance(entry, dict) and entry.get('mtime_ns') == mtime_ns and entry.get('size') == size
+                and isinstance(entry.get('values'), dict)):
+            result = entry['values']
+        else:
+            result = func(path)
+            disk_cache[path] = {'mtime_ns': mtime_ns, 'size': size, 'values': result}
+            # Write through a temp file so concurrent runs never leave a half-written cache
+            tmp_path = f"{cache_file}.tmp.{os.getpid()}"
+            try:
+                os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(disk_cache, f)
+                os.replace(tmp_path, cache_file)
+            except OSError:
+                # The cache is only an optimization; ignore unwritable locations
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+
+        # Read-only view, callers share the cached dict
+        return MappingProxyType(result)
+
+    @functools.wraps(func)
+    def wrapper(path):
+        path = os.path.abspath(path)
+        try:
+            st = os.stat(path)
+        except OSError:
+            return MappingProxyType(func(path))
+        return load_cached(path, st.st_mtime_ns, st.st_size)
+
+    wrapper.cache_clear = load_cached.cache_clear
+    return wrapper
+
+@cached_config
+def load_config(path):
+    """Load configuration values from a config file if provided"""
+    import configparser
+
+    config = configparser.ConfigParser()
+    config.read(path)
+    return dict(config['DEFAULT'])
+
+@functools.lru_cache(maxsize=None)
+def _dir_index(path):
+    """Return the names of all entries in a directory, read with a single scandir"""
+    try:
+        with os.scandir(path) as it:
+            return frozenset(entry.name for entry in it)
+    except OSError:
+        return frozenset()
+
+def _file_exists(file_name, directory=None):
+    """Check one of several names in a directory against a single cached listing, confirming misses with a real stat"""
+    directory = directory or os.getcwd()
+    # The stat fallback keeps case-insensitive filesystems working (Index.tsx for index.tsx)
+    return file_name in _dir_index(directory) or os.path.exists(os.path.join(directory, file_name))
+
+def get_user_action_choice():
+    """Prompt user to select an action"""
+    # Fail fast instead of blocking on input() when run from CI or a pipe
+    if not sys.stdin.isatty():
+        print("Error: --action is required in non-interactive mode", file=sys.stderr)
+        sys.exit(2)
+
+    actions = list(_ACTIONS)
+
+    print("Please select an action:")
+    for i, action in enumerate(actions, 1):
+        print(f"{i}. {action}")
+
+    while True:
+        try:
+            choice = input("Enter the number of your choice: ").strip()
+            choice_idx = int(choice) - 1
+            if 0 <= choice_idx < len(actions):
+                return actions[choice_idx]
+            else:
+                print(f"Please enter a number between 1 and {len(actions)}")
+        except ValueError:
+            print("Please enter a valid number")
+        except KeyboardInterrupt:
+            print()
+            sys.exit(1)
+
+def create_new_file(path, content=None, copy_from=None):
+    """Create a new file from content (str or bytes) or as a copy of copy_from, aborting if it already exists"""
+    # Write to a temporary file and link it into place, so an interrupted
+    # run never leaves a half-written file behind
+    tmp_path = f"{path}.tmp.{os.getpid()}"
+    try:
+        if copy_from is not None:
+            # Let the OS copy the bytes (sendfile on Linux) instead of reading them into Python
+            shutil.copyfile(copy_from, tmp_path)
+        else:
+            if isinstance(content, str):
+                content = content.encode('utf-8')
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                # Write the bytes straight to the descriptor, bypassing the text io stack
+                data = memoryview(content)
+                while data:
+                    data = data[os.write(fd, data):]
+            finally:
+                os.close(fd)
+
+        # Publish atomically: os.link fails instead of overwriting a file created meanwhile
+        try:
+            os.link(tmp_path, path)
+        except FileExistsError:
+            print(f"Error: {path} already exists. Aborting.")
+            sys.exit(1)
+        except OSError:
+            # No hard links here (FAT/exFAT drives, some shared folders and SMB mounts):
+            # create the file exclusively and copy the temporary file into it
+            try:
+                fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+            except FileExistsError:
+                print(f"Error: {path} already exists. Aborting.")
+                sys.exit(1)
+            with open(tmp_path, 'rb') as src, os.fdopen(fd, 'wb') as dst:
+                shutil.copyfileobj(src, dst)
+    finally:
+        try:
+            os.unlink(tmp_path)
+        except FileNotFoundError:
+            pass
+
+def create_gh_pages_config(app_base_path, verbose=False, dry_run=False):
+    """Create vite.gh-pages.config.ts file"""
+    config_file = "vite.gh-pages.config.ts"
+
+    # Check if file already exists (a real run checks atomically when creating the file)
+    if dry_run and os.path.exists(config_file):
+        print(f"Error: {config_file} already exists. Aborting.")
+        sys.exit(1)
+
+    if verbose:
+        print(f"Preparing to create {config_file} with app base path: {app_base_path}")
+
+    # Create the file with the specified content
+    content = _GH_PAGES_TEMPLATE.format_map({'app_base_path': app_base_path})
+
     if dry_run:
-        print(f"[DRY RUN] Would create {config_file} with app name: {app_name}")
-        print(f"[DRY RUN] App name dashed: {app_name_dashed}")
-        print(f"[DRY RUN] App name capitalized: {app_name_caps}")
+        print(f"[DRY RUN] Would create {config_file} with app base path: {app_base_path}")
     else:
-        with open(config_file, 'w') as f:
-            f.write(content)
-        print(f"Created {config_file} with app name: {app_name}")
-        print(f"App name dashed: {app_name_dashed}")
-        print(f"App name capitalized: {app_name_caps}")
+        create_new_file(config_file, content)
+        print(f"Created {config_file} with app base path: {app_base_path}")
 
     return True
 
-def build_gh_pages(verbose=False, dry_run=False):
-    """Build the project for GitHub Pages"""
-    config_file = "vite.gh-pages.config.ts"
+@functools.lru_cache(maxsize=32)
+def _derive_names(app_name):
+    """Return the dashed and capitalized forms of an app name, e.g. ('my-app', 'MyApp')"""
+    parts = [part for part in re.split(r'[-\s]+', app_name.strip()) if part]
+    app_name_dashed = '-'.join(part.lower() for part in parts)
+    app_name_caps = ''.join(part.capitalize() for part in parts)
+    return app_name_dashed, app_name_caps
+
+def create_bundle_config(app_name, verbose=False, dry_run=False):
+    """Create vite.react-angular.config.ts file"""
+    config_file = "vite.react-angular.config.ts"
+
+    # Check if file already exists (a real run checks atomically when creating the file)
+    if dry_run and os.path.exists(config_file):
+        print(f"Error: {config_file} already exists. Aborting.")
+        sys.exit(1)
+
+    # Create dashed version and capitalized version of app name
+    app_name_dashed, app_name_caps = _derive_names(app_name)
+
+    if verbose:
+        sys.stdout.write(f"Preparing to create {config_file} with app name: {app_name}\n"
+                         f"App name dashed: {app_name_dashed}\n"
+                         f"App name capitalized: {app_name_caps}\n")
+
+    # Create the file with the specified content
+    content = _BUNDLE_TEMPLATE.format_map({'app_name_caps': app_name_caps, 'app_name_dashed': app_name_dashed})
+
+    if dry_run:
+        sys.stdout.write(f"[DRY RUN] Would create {config_file} with app name: {app_name}\n"
+                         f"[DRY RUN] App name dashed: {app_name_dashed}\n"
+                         f"[DRY RUN] App name capitalized: {app_name_caps}\n")
+    else:
+        create_new_file(config_file, content)
+        sys.stdout.write(f"Created {config_file} with app name: {app_name}\n"
+                         f"App name dashed: {app_name_dashed}\n"
+                         f"App name capitalized: {app_name_caps}\n")
+
+    return True
+
+def exec_command(cmd):
+    """Replace the current process with cmd; never returns on success (except on Windows)"""
+    import subprocess
+
+    if os.name == 'nt':
+        # execvp cannot launch .cmd shims and detaches from the console on Windows
+        subprocess.run(cmd, check=True, stdin=subprocess.DEVNULL)
+        return
+    # Flush pending output, it would be lost when the process image is replaced
+    sys.stdout.flush()
+    sys.stderr.flush()
+    # The build tools never read stdin, don't hand them the terminal
+    devnull = os.open(os.devnull, os.O_RDONLY)
+    os.dup2(devnull, 0)
+    os.close(devnull)
+    os.execvp(cmd[0], cmd)
+
+def _run_vite_build(config_file, purpose, start_message, setup_action, verbose=False, dry_run=False):
+    """Run `vite build` with the given config file, e.g. purpose='Build'"""
+    import subprocess
 
     # Check if config file exists
     if not os.path.exists(config_file):
-        print(f"Error: {config_file} not found. Please run --action=add-config-gh-pages first.")
+        print(f"Error: {config_file} not found. Please run --action={setup_action} first.")
         sys.exit(1)
 
     if verbose:
-        print(f"Config file {config_file} exists, proceeding with build")
+        print(f"Config file {config_file} exists, proceeding with {purpose.lower()}")
 
     # Prepare the build command
-    build_cmd = ["vite", "build", "--config", config_file]
+    build_cmd = [*get_vite_command(), "build", "--config", config_file]
 
     # Execute the build command
     try:
         if dry_run:
             print(f"[DRY RUN] Would execute: {' '.join(build_cmd)}")
-            print("[DRY RUN] Build would be completed")
+            print(f"[DRY RUN] {purpose} would be completed")
         else:
-            print("Building project for GitHub Pages...")
+            print(start_message)
             if verbose:
                 print(f"Executing: {' '.join(build_cmd)}")
-            subprocess.run(build_cmd, check=True)
-            print("Build completed successfully.")
+            exec_command(build_cmd)
         return True
     except subprocess.CalledProcessError as e:
-        print(f"Build failed with exit code {e.returncode}.")
+        print(f"{purpose} failed with exit code {e.returncode}.")
         sys.exit(e.returncode)
     except FileNotFoundError:
-        print("Error: 'vite' command not found. Make sure Vite is installed.")
+        print(f"Error: '{build_cmd[0]}' command not found. Make sure Vite is installed.")
         sys.exit(1)
 
+def build_gh_pages(verbose=False, dry_run=False):
+    """Build the project for GitHub Pages"""
+    return _run_vite_build("vite.gh-pages.config.ts", "Build", "Building project for GitHub Pages...",
+                           "add-config-gh-pages", verbose=verbose, dry_run=dry_run)
+
+@functools.lru_cache(maxsize=1)
+def get_vite_command():
+    """Return the command prefix for vite as absolute paths, preferring the project's local binary"""
+    bin_dir = os.path.join(os.getcwd(), 'node_modules', '.bin')
+    vite_bin = shutil.which('vite', path=bin_dir) or shutil.which('vite')
+    if vite_bin:
+        return (vite_bin,)
+    npx_bin = shutil.which('npx') or 'npx'
+    return (npx_bin, "--no-install", "vite")
+
+@functools.lru_cache(maxsize=1)
+def get_npm_command():
+    """Return the absolute path of npm, so spawning it skips the PATH search"""
+    return shutil.which('npm') or 'npm'
+
 def deploy_gh_pages(verbose=False, dry_run=False):
     """Deploy the project to GitHub Pages"""
-    # Prepare the deploy command
-    deploy_cmd = ["npm", "run", "build-gh-pages"]
-
-    try:
-        if dry_run:
-            print(f"[DRY RUN] Would execute: {' '.join(deploy_cmd)}")
-            print("[DRY RUN] Deployment would be completed")
-        else:
-            print("Deploying to GitHub Pages...")
-            if verbose:
-                print(f"Executing: {' '.join(deploy_cmd)}")
-            subprocess.run(deploy_cmd, check=True)
-            print("Deployment completed successfully.")
-        return True
-    except subprocess.CalledProcessError as e:
-        print(f"Deployment failed with exit code {e.returncode}.")
-        sys.exit(e.returncode)
-    except FileNotFoundError:
-        print("Error: 'npm' command not found. Make sure npm is installed.")
-        sys.exit(1)
+    # Same vite command as build_gh_pages, called directly instead of through `npm run build-gh-pages`
+    return _run_vite_build("vite.gh-pages.config.ts", "Deployment", "Deploying to GitHub Pages...",
+                           "add-config-gh-pages", verbose=verbose, dry_run=dry_run)
 
 
 # New Area for next scripts
+def _read_text(path):
+    """Return the contents of a UTF-8 text file"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read()
+
 def deploy_next_gh_pages(app_base_path, verbose=False, dry_run=False):
     """Deploy Next.js project to GitHub Pages"""
+    import json
+    import subprocess
+    from concurrent.futures import ThreadPoolExecutor
+
+    # Checked before anything is touched, so a missing value never leaves the config moved aside
+    if not app_base_path:
+        print("[ERROR] Missing app_base_path (repo name). Exiting.")
+        sys.exit(1)
 
     local_config = "next.config.ts"
     backup_config = "next.config.org.ts"
     template_config_name = "config-next.config.ts"
-    script_dir = os.path.dirname(os.path.abspath(__file__))
+    package_file = "package.json"
+    script_dir = _SCRIPT_DIR
+    template_path = os.path.join(script_dir, template_config_name)
+
+    local_config_found = os.path.exists(local_config)
+    package_found = os.path.exists(package_file)
+
+    # After the backup the local config is gone; a dry run doesn't move it
+    local_config_exists = local_config_found and dry_run
+
+    # Checked before the backup, so a missing template never leaves the config moved aside
+    if not local_config_exists and not os.path.exists(template_path):
+        print(f"[ERROR] Template config file not found: {template_path}")
+        sys.exit(1)
+
+    # Read the template and package.json in the background while the backup runs;
+    # each result is only awaited where it is used
+    executor = ThreadPoolExecutor(max_workers=2)
+    template_content = None if local_config_exists else executor.submit(_read_text, template_path)
+    package_content = executor.submit(_read_text, package_file) if package_found else None
+    executor.shutdown(wait=False)
 
     # Step 1: Backup existing local config if exists
-    if os.path.exists(local_config):
+    if local_config_found:
         if verbose:
             print(f"Backing up {local_config} to {backup_config}")
         if not dry_run:
             shutil.move(local_config, backup_config)
 
-    # Step 2: Check if local config already exists (after backup, it doesn't)
-    local_config_exists = os.path.exists(local_config)
-
+    # Step 2: Create the local config from the template unless it is reused
     if not local_config_exists:
-        if not app_base_path:
-            print("[ERROR] Missing app_base_path (repo name). Exiting.")
-            sys.exit(1)
-
-        template_path = os.path.join(script_dir, template_config_name)
-        if not os.path.exists(template_path):
-            print(f"[ERROR] Template config file not found: {template_path}")
-            sys.exit(1)
-
         # Read and modify template
-        with open(template_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        content = template_content.result()
 
         content = content.replace("const repo = 'repo-name';", f"const repo = '{app_base_path}';")
 
@@ -296,36 +463,44 @@ def deploy_next_gh_pages(app_base_path, verbose=False, dry_run=False):
     print(f"[SUCCESS] Local Next.js config is ready: {local_config}")
 
     # Step 3: Update package.json scripts
-    package_file = "package.json"
-    if not os.path.exists(package_file):
+    if not package_found:
         print("[ERROR] package.json not found in current directory")
         sys.exit(1)
 
-    with open(package_file, 'r+', encoding='utf-8') as f:
-        data = json.load(f)
-        scripts = data.get("scripts", {})
-
-        modified = False
-        if "export" not in scripts:
-            scripts["export"] = "next export"
-            modified = True
-        if "predeploy" not in scripts:
-            scripts["predeploy"] = "npm run build && touch out/.nojekyll"
-            modified = True
-        if "deploy" not in scripts:
-            scripts["deploy"] = "gh-pages -d out"
-            modified = True
-
-        if modified:
-            if verbose:
-                print("Updating package.json scripts")
-            if not dry_run:
-                f.seek(0)
-                json.dump(data, f, indent=2)
-                f.truncate()
-            else:
-                print("[DRY RUN] Would update package.json scripts:")
-                print(json.dumps(scripts, indent=2))
+    required_scripts = {
+        "export": "next export",
+        "predeploy": "npm run build && touch out/.nojekyll",
+        "deploy": "gh-pages -d out",
+    }
+
+    data = json.loads(package_content.result())
+    scripts = data.setdefault("scripts", {})
+    missing = {name: command for name, command in required_scripts.items() if name not in scripts}
+
+    # Repeat deploys already have all the scripts, skip rewriting the file then
+    if not missing:
+        if verbose:
+            print("package.json scripts are already set up")
+    else:
+        scripts.update(missing)
+        if verbose:
+            print("Updating package.json scripts")
+        if not dry_run:
+            # Write next to the original and rename, so package.json is never left truncated
+            tmp_path = f"{package_file}.tmp.{os.getpid()}"
+            try:
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    f.write(json.dumps(data, indent=2, ensure_ascii=False))
+                os.replace(tmp_path, package_file)
+            except BaseException:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+                raise
+        else:
+            print("[DRY RUN] Would update package.json scripts:")
+            print(json.dumps(scripts, indent=2, ensure_ascii=False))
 
     # Step 4: Run predeploy and deploy
     if dry_run:
@@ -334,9 +509,9 @@ def deploy_next_gh_pages(app_base_path, verbose=False, dry_run=False):
     else:
         try:
             print("Running: npm run predeploy")
-            subprocess.run(["npm", "run", "predeploy"], check=True)
+            subprocess.run([get_npm_command(), "run", "predeploy"], check=True, stdin=subprocess.DEVNULL)
             print("Running: npm run deploy")
-            subprocess.run(["npm", "run", "deploy"], check=True)
+            subprocess.run([get_npm_command(), "run", "deploy"], check=True, stdin=subprocess.DEVNULL)
         except subprocess.CalledProcessError as e:
             print(f"[ERROR] Deployment failed with exit code {e.returncode}")
             sys.exit(e.returncode)
@@ -348,7 +523,7 @@ def deploy_next_gh_pages(app_base_path, verbose=False, dry_run=False):
 
 
 def get_dir_deploy_script():
-    return os.path.dirname(os.path.abspath(__file__))
+    return _SCRIPT_DIR
 
 def get_dir_current_folder():
     return os.path.abspath(os.getcwd())
@@ -376,38 +551,63 @@ def get_file_path(file_name, is_dir_deploy_script=True):
 
 def generate_bundle(verbose=False, dry_run=False):
     """Generate a bundle using the react-angular config"""
-    config_file = "vite.react-angular.config.ts"
+    return _run_vite_build("vite.react-angular.config.ts", "Bundle generation", "Generating bundle...",
+                           "add-config-bundle", verbose=verbose, dry_run=dry_run)
+
+def build_all(verbose=False, dry_run=False):
+    """Build the GitHub Pages site and the bundle concurrently"""
+    import subprocess
+
+    # Both configs build into dist/ and the bundle config empties it first,
+    # so the bundle gets its own output directory when the two run together
+    targets = [
+        ("GitHub Pages build", "vite.gh-pages.config.ts", "add-config-gh-pages", []),
+        ("Bundle generation", "vite.react-angular.config.ts", "add-config-bundle", ["--outDir", "dist-bundle"]),
+    ]
 
-    # Check if config file exists
-    if not os.path.exists(config_file):
-        print(f"Error: {config_file} not found. Please run --action=add-config-bundle first.")
-        sys.exit(1)
+    # Check that both config files exist before starting anything
+    for _, config_file, setup_action, _ in targets:
+        if not os.path.exists(config_file):
+            print(f"Error: {config_file} not found. Please run --action={setup_action} first.")
+            sys.exit(1)
 
-    if verbose:
-        print(f"Config file {config_file} exists, proceeding with bundle generation")
+    build_cmds = [[*get_vite_command(), "build", "--config", config_file, *extra_args]
+                  for _, config_file, _, extra_args in targets]
 
-    # Prepare the build command
-    build_cmd = ["vite", "build", "--config", config_file]
+    if dry_run:
+        for build_cmd in build_cmds:
+            print(f"[DRY RUN] Would execute: {' '.join(build_cmd)}")
+        print("[DRY RUN] Both builds would run in parallel")
+        return True
 
-    # Execute the build command
+    # Each vite build runs in its own Node process, so the two use separate cores
+    print("Building GitHub Pages site and bundle in parallel...")
+    processes = []
     try:
-        if dry_run:
-            print(f"[DRY RUN] Would execute: {' '.join(build_cmd)}")
-            print("[DRY RUN] Bundle generation would be completed")
-        else:
-            print("Generating bundle...")
+        for build_cmd in build_cmds:
             if verbose:
                 print(f"Executing: {' '.join(build_cmd)}")
-            subprocess.run(build_cmd, check=True)
-            print("Bundle generation completed successfully.")
-        return True
-    except subprocess.CalledProcessError as e:
-        print(f"Bundle generation failed with exit code {e.returncode}.")
-        sys.exit(e.returncode)
+            # Keep our messages ahead of the children's output
+            sys.stdout.flush()
+            processes.append(subprocess.Popen(build_cmd, stdin=subprocess.DEVNULL))
     except FileNotFoundError:
-        print("Error: 'vite' command not found. Make sure Vite is installed.")
+        print(f"Error: '{build_cmds[0][0]}' command not found. Make sure Vite is installed.")
+        for process in processes:
+            process.wait()
         sys.exit(1)
 
+    exit_code = 0
+    for (purpose, _, _, _), process in zip(targets, processes):
+        returncode = process.wait()
+        if returncode != 0:
+            print(f"{purpose} failed with exit code {returncode}.")
+            exit_code = exit_code or returncode
+
+    if exit_code:
+        sys.exit(exit_code)
+    print("Build and bundle generation completed successfully.")
+    return True
+
 def generate_config(verbose=False, dry_run=False):
     """Generate config-deploy.conf file for deployment configuration"""
     index_file = "index.tsx"
@@ -418,27 +618,22 @@ def generate_config(verbose=False, dry_run=False):
         print(f"Error: {index_file} not found. Not a React folder with {os.getcwd()}")
         sys.exit(1)
 
-    # Check if config-deploy.conf already exists
-    if os.path.exists(config_file):
+    # Check if config-deploy.conf already exists (a real run checks atomically when creating the file)
+    if dry_run and os.path.exists(config_file):
         print(f"Error: {config_file} already exists.")
         sys.exit(1)
 
     if verbose:
         print(f"Preparing to create {config_file}")
 
-    # Create the file with the specified content
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    example_config = os.path.join(script_dir, 'config-deploy-example.conf')
-    
-    with open(example_config, 'r') as f:
-        content = f.read()
+    # Create the file as a copy of the example config
+    example_config = os.path.join(_SCRIPT_DIR, 'config-deploy.example.conf')
 
     if dry_run:
         print(f"[DRY RUN] Would create {config_file}")
     else:
         try:
-            with open(config_file, 'w') as f:
-                f.write(content)
+            create_new_file(config_file, copy_from=example_config)
             print(f"Successfully created {config_file}")
             return True
         except Exception as e:
@@ -458,9 +653,9 @@ def update_index_tsx(verbose=False, dry_run=False):
         print(f"Error: {index_file} not found. This action requires an existing index.tsx file.")
         sys.exit(1)
 
-    # Check if template file exists
-    if not os.path.exists(template_file):
-        print(f"Error: {template_file} not found. This action requires the template file.")
+    # Check if template file exists next to this script
+    if not os.path.exists(os.path.join(_SCRIPT_DIR, template_file)):
+        print(f"Error: {template_file} not found in {_SCRIPT_DIR}. This action requires the template file.")
         sys.exit(1)
 
     if verbose:
@@ -471,10 +666,7 @@ def update_index_tsx(verbose=False, dry_run=False):
         print(f"[DRY RUN] Would create backup of {index_file} as {backup_file}")
     else:
         try:
-            with open(index_file, 'r') as src:
-                content = src.read()
-            with open(backup_file, 'w') as dst:
-                dst.write(content)
+            shutil.copyfile(index_file, backup_file)
             if verbose:
                 print(f"Created backup of {index_file} as {backup_file}")
         except Exception as e:
@@ -497,39 +689,251 @@ def update_index_tsx(verbose=False, dry_run=False):
 
     # Replace content with template
     try:
-        with open(template_file, 'r') as src:
-            template_content = src.read()
-        with open(index_file, 'w') as dst:
-            dst.write(template_content)
+        shutil.copyfile(os.path.join(_SCRIPT_DIR, template_file), index_file)
         print(f"Successfully updated {index_file} with content from {template_file}")
         return True
     except Exception as e:
         print(f"Error updating file: {str(e)}")
         sys.exit(1)
 
-def main():
-    parser = argparse.ArgumentParser(
-        description="Deploy React projects to GitHub Pages and generate bundles.",
-        epilog="Example: ./run-deploy.py --action=add-config-gh-pages --app-base-path=/user/repo/"
+def _get_app_base_path(args, config):
+    """Return app_base_path from args or config, prompting the user if missing"""
+    app_base_path = args.app_base_path or config.get('app_base_path')
+    if not app_base_path:
+        app_base_path = input("Enter the app base path (e.g., /user/repo/): ").strip()
+    return app_base_path
+
+def _get_app_name(args, config):
+    """Return app_name from args or config, prompting the user (default: current folder) if missing"""
+    app_name = args.app_name or config.get('app_name')
+    if not app_name:
+        # Suggest current folder name as default
+        current_folder = os.path.basename(os.getcwd())
+        app_name = input(f"Enter the app name (default: {current_folder}): ").strip()
+        if not app_name:
+            app_name = current_folder
+    return app_name
+
+def _handle_add_config_gh_pages(args, config):
+    create_gh_pages_config(_get_app_base_path(args, config), verbose=args.verbose, dry_run=args.dry_run)
+
+def _handle_add_config_bundle(args, config):
+    create_bundle_config(_get_app_name(args, config), verbose=args.verbose, dry_run=args.dry_run)
+
+def _handle_build_gh_pages(args, config):
+    build_gh_pages(verbose=args.verbose, dry_run=args.dry_run)
+
+def _handle_deploy_gh_pages(args, config):
+    deploy_gh_pages(verbose=args.verbose, dry_run=args.dry_run)
+
+def _handle_generate_bundle(args, config):
+    generate_bundle(verbose=args.verbose, dry_run=args.dry_run)
+
+def _handle_update_index_tsx(args, config):
+    update_index_tsx(verbose=args.verbose, dry_run=args.dry_run)
+
+def _handle_generate_config(args, config):
+    generate_config(verbose=args.verbose, dry_run=args.dry_run)
+
+def _handle_deploy_next_gh_pages(args, config):
+    print('deploy-next-gh-pages')
+    app_base_path = args.app_base_path or config.get('app_base_path')
+    deploy_next_gh_pages(app_base_path, verbose=args.verbose, dry_run=args.dry_run)
+
+def _handle_bootstrap_all(args, config):
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    # Validate everything up front, so a failure never leaves a partial bootstrap behind
+    if not _file_exists("index.tsx"):
+        print(f"Error: index.tsx not found. Not a React folder with {os.getcwd()}")
+        sys.exit(1)
+    existing = [name for name in ("vite.gh-pages.config.ts", "vite.react-angular.config.ts", "config-deploy.conf")
+                if _file_exists(name)]
+    for name in existing:
+        print(f"Error: {name} already exists. Aborting.")
+    if existing:
+        sys.exit(1)
+    if not _file_exists('config-deploy.example.conf', _SCRIPT_DIR):
+        print(f"Error: config-deploy.example.conf not found in {_SCRIPT_DIR}. This action requires the example config.")
+        sys.exit(1)
+
+    # Ask for missing values before any file is written
+    app_base_path = _get_app_base_path(args, config)
+    app_name = _get_app_name(args, config)
+
+    # The three files are independent, write them concurrently
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        futures = [
+            executor.submit(create_gh_pages_config, app_base_path, verbose=args.verbose, dry_run=args.dry_run),
+            executor.submit(create_bundle_config, app_name, verbose=args.verbose, dry_run=args.dry_run),
+            executor.submit(generate_config, verbose=args.verbose, dry_run=args.dry_run),
+        ]
+        for future in as_completed(futures):
+            future.result()
+
+def _handle_build_all(args, config):
+    build_all(verbose=args.verbose, dry_run=args.dry_run)
+
+# Action name -> handler(args, config); also the list offered by --action and the interactive prompt
+_ACTIONS = {
+    'add-config-gh-pages': _handle_add_config_gh_pages,
+    'add-config-bundle': _handle_add_config_bundle,
+    'build-gh-pages': _handle_build_gh_pages,
+    'deploy-gh-pages': _handle_deploy_gh_pages,
+    'generate-bundle': _handle_generate_bundle,
+    'update-index-tsx': _handle_update_index_tsx,
+    'generate-config': _handle_generate_config,
+    'deploy-next-gh-pages': _handle_deploy_next_gh_pages,
+    'bootstrap-all': _handle_bootstrap_all,
+    'build-all': _handle_build_all,
+}
+
+# Actions that read app_base_path/app_name from the config file
+_ACTIONS_NEEDING_CONFIG = {
+    'add-config-gh-pages',
+    'add-config-bundle',
+    'deploy-next-gh-pages',
+    'bootstrap-all',
+}
+
+_USAGE = """usage: run-deploy-react-project.py [-h] [--action ACTION] [--app-base-path APP_BASE_PATH]
+                                   [--app-name APP_NAME] [--config CONFIG] [--verbose]
+                                   [--dry-run] [--no-config]"""
+
+_HELP = _USAGE + """
+
+Deploy React projects to GitHub Pages and generate bundles.
+
+options:
+  -h, --help            show this help message and exit
+  --action ACTION       Action to perform, one of:
+                        """ + ", ".join(_ACTIONS) + """
+  --app-base-path APP_BASE_PATH
+                        Base path for GitHub Pages (e.g., /user/repo/)
+  --app-name APP_NAME   Application name for bundle generation
+  --config CONFIG, -c CONFIG
+                        Path to config file (INI format with [DEFAULT] section)
+  --verbose, -v         Enable verbose output
+  --dry-run, -n         Perform a dry run
+  --no-config           Skip loading the default config file
+
+Example: ./run-deploy.py --action=add-config-gh-pages --app-base-path=/user/repo/"""
+
+# Command-line options mapped to their attribute names
+_VALUE_OPTIONS = {
+    '--action': 'action',
+    '--app-base-path': 'app_base_path',
+    '--app-name': 'app_name',
+    '--config': 'config',
+    '-c': 'config',
+}
+_FLAG_OPTIONS = {
+    '--verbose': 'verbose',
+    '-v': 'verbose',
+    '--dry-run': 'dry_run',
+    '-n': 'dry_run',
+    '--no-config': 'no_config',
+}
+
+def arg_error(message):
+    """Print usage and an error message, then exit like argparse does"""
+    print(_USAGE, file=sys.stderr)
+    print(f"run-deploy-react-project.py: error: {message}", file=sys.stderr)
+    sys.exit(2)
+
+def _resolve_long_option(option):
+    """Expand a unique prefix such as --dry to its full long option name"""
+    long_options = [name for name in (*_VALUE_OPTIONS, *_FLAG_OPTIONS, '--help') if name.startswith('--')]
+    if option in long_options:
+        return option
+    matches = [name for name in long_options if name.startswith(option)]
+    if len(matches) == 1:
+        return matches[0]
+    if matches:
+        arg_error(f"ambiguous option: {option} could match {', '.join(matches)}")
+    arg_error(f"unrecognized arguments: {option}")
+
+def _next_value(argv, i, option):
+    """Return argv[i] as the value of option, rejecting a missing value or another option like argparse"""
+    if i >= len(argv) or (argv[i].startswith('-') and argv[i] != '-'):
+        arg_error(f"argument {option}: expected one argument")
+    return argv[i]
+
+def parse_args(argv):
+    """Parse command-line arguments (a minimal replacement for argparse)"""
+    args = SimpleNamespace(
+        action=None,
+        app_base_path=None,
+        app_name=None,
+        config=None,
+        verbose=False,
+        dry_run=False,
+        no_config=False,
     )
-    parser.add_argument('--action', choices=[
-        'add-config-gh-pages', 
-        'add-config-bundle', 
-        'build-gh-pages', 
-        'deploy-gh-pages', 
-        'generate-bundle',
-        'update-index-tsx',
-        'generate-config',
-        'deploy-next-gh-pages'
-    ], help='Action to perform')
-    parser.add_argument('--app-base-path', help='Base path for GitHub Pages (e.g., /user/repo/)')
-    parser.add_argument('--app-name', help='Application name for bundle generation')
-    parser.add_argument('--config', '-c', help='Path to config file (INI format with [DEFAULT] section)')
-    parser.add_argument('--verbose', '-v', action='store_true', help='Enable verbose output')
-    parser.add_argument('--dry-run', '-n', action='store_true', help='Perform a dry run')
-    parser.add_argument('--no-config', action='store_true', help='Skip loading the default config file')
-
-    args = parser.parse_args()
+
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        i += 1
+
+        if arg == '--':
+            # Everything after a bare -- is positional, and this script takes none
+            if argv[i:]:
+                arg_error(f"unrecognized arguments: {' '.join(argv[i:])}")
+            break
+
+        if arg.startswith('--'):
+            # --key=value, --key value and --flag, with unique prefixes like argparse
+            option, sep, value = arg.partition('=')
+            option = _resolve_long_option(option)
+            if not sep:
+                value = None
+
+            if option == '--help':
+                print(_HELP)
+                sys.exit(0)
+            if option in _FLAG_OPTIONS:
+                if value is not None:
+                    arg_error(f"argument {option}: ignored explicit argument '{value}'")
+                setattr(args, _FLAG_OPTIONS[option], True)
+            else:
+                if value is None:
+                    value = _next_value(argv, i, option)
+                    i += 1
+                setattr(args, _VALUE_OPTIONS[option], value)
+
+        elif arg.startswith('-') and len(arg) > 1:
+            # Short options, possibly combined: -v, -vn, -cFILE, -c=FILE, -vc FILE
+            for j in range(1, len(arg)):
+                option = f"-{arg[j]}"
+                if option == '-h':
+                    print(_HELP)
+                    sys.exit(0)
+                if option in _FLAG_OPTIONS:
+                    setattr(args, _FLAG_OPTIONS[option], True)
+                elif option in _VALUE_OPTIONS:
+                    value = arg[j + 1:]
+                    if value.startswith('='):
+                        value = value[1:]
+                    if not value:
+                        value = _next_value(argv, i, option)
+                        i += 1
+                    setattr(args, _VALUE_OPTIONS[option], value)
+                    break
+                else:
+                    arg_error(f"unrecognized arguments: {arg}")
+
+        else:
+            arg_error(f"unrecognized arguments: {arg}")
+
+    if args.action is not None and args.action not in _ACTIONS:
+        choices = ", ".join(f"'{c}'" for c in _ACTIONS)
+        arg_error(f"argument --action: invalid choice: '{args.action}' (choose from {choices})")
+
+    return args
+
+def main():
+    args = parse_args(sys.argv[1:])
 
     # Initialize configuration
     config = {}
@@ -537,12 +941,19 @@ def main():
     if args.verbose:
         print('start main')
 
-    # Check for default config file if --no-config is not specified and --config is not provided
+    # Get action from args or prompt user
+    action = args.action
+    if not action:
+        action = get_user_action_choice()
+
+    # Check for default config file if --no-config is not specified and --config is not provided.
+    # Actions that don't read app_base_path/app_name skip loading it altogether.
     script_dir = get_dir_current_folder()
     default_config = os.path.join(script_dir, 'config-deploy.conf')
     if args.verbose:
         print(default_config)
-    if not args.no_config and not args.config and os.path.isfile(default_config):
+    if (action in _ACTIONS_NEEDING_CONFIG and not args.no_config and not args.config
+            and os.path.isfile(default_config)):
         if args.verbose:
             print(f"Loading default config file: {default_config}")
         config = load_config(default_config)
@@ -554,52 +965,8 @@ def main():
             sys.exit(1)
         config = load_config(args.config)
 
-    # Get action from args or prompt user
-    action = args.action
-    if not action:
-        action = get_user_action_choice()
-
-    # Get app_base_path from args or config
-    app_base_path = args.app_base_path or config.get('app_base_path')
-
-    # Get app_name from args or config
-    app_name = args.app_name or config.get('app_name')
-
     # Execute the selected action
-    if action == 'add-config-gh-pages':
-        if not app_base_path:
-            app_base_path = input("Enter the app base path (e.g., /user/repo/): ").strip()
-        create_gh_pages_config(app_base_path, verbose=args.verbose, dry_run=args.dry_run)
+    _ACTIONS[action](args, config)
 
-    elif action == 'add-config-bundle':
-        if not app_name:
-            # Suggest current folder name as default
-            current_folder = os.path.basename(os.getcwd())
-            app_name = input(f"Enter the app name (default: {current_folder}): ").strip()
-            if not app_name:
-                app_name = current_folder
-        create_bundle_config(app_name, verbose=args.verbose, dry_run=args.dry_run)
-
-    elif action == 'build-gh-pages':
-        build_gh_pages(verbose=args.verbose, dry_run=args.dry_run)
-
-    elif action == 'deploy-gh-pages':
-        deploy_gh_pages(verbose=args.verbose, dry_run=args.dry_run)
-
-    elif action == 'generate-bundle':
-        generate_bundle(verbose=args.verbose, dry_run=args.dry_run)
-
-    elif action == 'update-index-tsx':
-        update_index_tsx(verbose=args.verbose, dry_run=args.dry_run)
-
-    elif action == 'generate-config':
-        generate_config(verbose=args.verbose, dry_run=args.dry_run)
-
-    elif action == 'deploy-next-gh-pages':
-        print('deploy-next-gh-pages')
-        if not app_base_path:
-                    print("[ERROR] Missing app_base_path (repo name). Exiting.")
-                    sys.exit(1)
-        deploy_next_gh_pages(app_base_path, verbose=args.verbose, dry_run=args.dry_run)
 if __name__ == "__main__":
     main()
@@ -18,6 +18,16 @@ import subprocess
 import configparser
 import sys
 import random
+import functools
+from types import MappingProxyType
+
+_QUOTE_CHARS = ('"', "'")
+
+def _strip_quotes(value):
+    """Remove one pair of matching surrounding quotes from a path"""
+    if value and len(value) >= 2 and value[0] == value[-1] and value[0] in _QUOTE_CHARS:
+        return value[1:-1]
+    return value
 
 def get_random_number():
     """Return a random integer between 1 and 100"""
@@ -38,7 +48,12 @@ def confirm_index_exists(folder, label):
             sys.exit(1)
 
 def load_config(path):
-    """Load source/target values from a config file if provided"""
+    """Load source/target values from a config file, cached until the file changes"""
+    return _load_config_cached(os.path.abspath(path), os.path.getmtime(path))
+
+@functools.lru_cache(maxsize=8)
+def _load_config_cached(path, mtime):
+    """Parse a config file; mtime is part of the cache key only"""
     config = configparser.ConfigParser()
     config.read(path)
     result = {}
@@ -50,7 +65,8 @@ def load_config(path):
             result['target'] = default['target']
         if 'ignore_index_tsx' in default:
             result['ignore_index_tsx'] = default.getboolean('ignore_index_tsx', fallback=False)
-    return result
+    # Read-only view, callers share the cached dict
+    return MappingProxyType(result)
 
 def main():
     parser = argparse.ArgumentParser(
@@ -66,19 +82,12 @@ def main():
 
     args = parser.parse_args()
 
-    # Set defaults to current working directory if not provided
-    source = args.source or os.getcwd()
-    target = args.target or os.getcwd()
-
-    # Strip any surrounding quotes from source and target paths
-    if source and ((source.startswith('"') and source.endswith('"')) or (source.startswith("'") and source.endswith("'"))):
-        source = source[1:-1]
-    if target and ((target.startswith('"') and target.endswith('"')) or (target.startswith("'") and target.endswith("'"))):
-        target = target[1:-1]
+    cwd = os.getcwd()
+    config_data = {}
 
     # Check for default config file if --no-config is not specified and --config is not provided
     # Look for the config file in the current working directory
-    default_config = os.path.join(os.getcwd(), 'config-deploy.conf')
+    default_config = os.path.join(cwd, 'config-deploy.conf')
     if not args.no_config and not args.config:
         if args.verbose:
             print(f"Trying to reach config file at: {default_config}")
@@ -86,21 +95,6 @@ def main():
             if args.verbose:
                 print(f"Config file found. Loading default config file: {default_config}")
             config_data = load_config(default_config)
-            # Only use source/target from config if not provided as arguments
-            if args.source is None:
-                source = config_data.get('source', source)
-                # Strip any surrounding quotes from source path loaded from config
-                if source and ((source.startswith('"') and source.endswith('"')) or (source.startswith("'") and source.endswith("'"))):
-                    source = source[1:-1]
-                if args.verbose and 'source' in config_data:
-                    print(f"Using source from config file: {source}")
-            if args.target is None:
-                target = config_data.get('target', target)
-                # Strip any surrounding quotes from target path loaded from config
-                if target and ((target.startswith('"') and target.endswith('"')) or (target.startswith("'") and target.endswith("'"))):
-                    target = target[1:-1]
-                if args.verbose and 'target' in config_data:
-                    print(f"Using target from config file: {target}")
         elif args.verbose:
             print(f"Config file not found at: {default_config}")
 
@@ -114,21 +108,26 @@ def main():
         if args.verbose:
             print(f"Config file found. Loading config file: {args.config}")
         config_data = load_config(args.config)
-        # Only use source/target from config if not provided as arguments
-        if args.source is None:
-            source = config_data.get('source', source)
-            # Strip any surrounding quotes from source path loaded from config
-            if source and ((source.startswith('"') and source.endswith('"')) or (source.startswith("'") and source.endswith("'"))):
-                source = source[1:-1]
-            if args.verbose and 'source' in config_data:
-                print(f"Using source from config file: {source}")
-        if args.target is None:
-            target = config_data.get('target', target)
-            # Strip any surrounding quotes from target path loaded from config
-            if target and ((target.startswith('"') and target.endswith('"')) or (target.startswith("'") and target.endswith("'"))):
-                target = target[1:-1]
-            if args.verbose and 'target' in config_data:
-                print(f"Using target from config file: {target}")
+
+    # Command-line values win, then the config file, then the current working directory
+    if args.source is None:
+        source = config_data.get('source', cwd)
+    else:
+        source = args.source or cwd
+    if args.target is None:
+        target = config_data.get('target', cwd)
+    else:
+        target = args.target or cwd
+
+    # Strip any surrounding quotes from source and target paths
+    source = _strip_quotes(source)
+    target = _strip_quotes(target)
+
+    if args.verbose:
+        if args.source is None and 'source' in config_data:
+            print(f"Using source from config file: {source}")
+        if args.target is None and 'target' in config_data:
+            print(f"Using target from config file: {target}")
 
     # Ensure at least one of source or target is valid
     if not source and not target:
@@ -152,7 +151,7 @@ def main():
     ]
 
     # Add index.tsx to exclusions if configured
-    ignore_index_tsx = config_data.get('ignore_index_tsx', False) if 'config_data' in locals() else False
+    ignore_index_tsx = config_data.get('ignore_index_tsx', False)
     if ignore_index_tsx:
         rsync_cmd.append("--exclude=index.tsx")
         if args.verbose: